@@ -19,6 +19,47 @@ type PersonalInfoSectionProps = {
   form: any;
 };
 
+// Largest photo edge worth keeping: the PDF templates show the photo at up to
+// 150px and render at 2x device scale
+const MAX_PHOTO_DIMENSION = 300;
+const PHOTO_JPEG_QUALITY = 0.85;
+
+/**
+ * Downscale and recompress an uploaded photo before it is stored in the CV,
+ * keeping the request payload and PDF rendering cost small
+ * @param dataUrl Photo as read from the file input
+ * @returns JPEG data URL, or the original if it is already small enough
+ */
+const resizePhoto = (dataUrl: string): Promise<string> =>
+  new Promise((resolve) => {
+    const image = new Image();
+    image.onload = () => {
+      const scale = Math.min(1, MAX_PHOTO_DIMENSION / Math.max(image.width, image.height));
+      if (scale === 1) {
+        resolve(dataUrl);
+        return;
+      }
+
+      const canvas = document.createElement("canvas");
+      canvas.width = Math.round(image.width * scale);
+      canvas.height = Math.round(image.height * scale);
+      const context = canvas.getContext("2d");
+      if (!context) {
+        resolve(dataUrl);
+        return;
+      }
+
+      // JPEG has no alpha channel, so flatten transparent images onto white
+      context.fillStyle = "#ffffff";
+      context.fillRect(0, 0, canvas.width, canvas.height);
+      context.drawImage(image, 0, 0, canvas.width, canvas.height);
+      resolve(canvas.toDataURL("image/jpeg", PHOTO_JPEG_QUALITY));
+    };
+    // Fall back to the original if the browser cannot decode it
+    image.onerror = () => resolve(dataUrl);
+    image.src = dataUrl;
+  });
+
 const PersonalInfoSection = ({ form }: PersonalInfoSectionProps) => {
   const [photoPreview, setPhotoPreview] = useState<string | null>(null);
   const [uploadError, setUploadError] = useState<string | null>(null);
@@ -64,8 +105,8 @@ const PersonalInfoSection = ({ form }: PersonalInfoSectionProps) => {
     }
     
     const reader = new FileReader();
-    reader.onload = (e: ProgressEvent<FileReader>) => {
-      const result = e.target?.result as string;
+    reader.onload = async (e: ProgressEvent<FileReader>) => {
+      const result = await resizePhoto(e.target?.result as string);
       setPhotoPreview(result);
       form.setValue("personal.photoUrl", result);
     };
@@ -1,3 +1,8 @@
+// Formatted dates keyed by their input string. The preview re-renders on
+// every keystroke, so the same handful of dates is formatted over and over.
+const MAX_CACHED_DATES = 500;
+const formattedDateCache = new Map<string, string>();
+
 /**
  * Formats a date string in a consistent way
  * @param dateStr Date string to format
@@ -5,14 +10,42 @@
  */
 export function formatDate(dateStr?: string): string {
   if (!dateStr) return '';
-  
-  try {
-    const date = new Date(dateStr);
-    return date.toLocaleDateString('en-US', { 
-      month: 'short', 
-      year: 'numeric' 
-    });
-  } catch (e) {
-    return dateStr;
+
+  const cached = formattedDateCache.get(dateStr);
+  if (cached !== undefined) return cached;
+
+  const formatted = formatDateUncached(dateStr);
+
+  // Drop everything once full; intermediate strings typed into a date
+  // field should not accumulate forever
+  if (formattedDateCache.size >= MAX_CACHED_DATES) {
+    formattedDateCache.clear();
   }
-}
\ No newline at end of file
+  formattedDateCache.set(dateStr, formatted);
+
+  return formatted;
+}
+
+// "YYYY-MM" or "YYYY-MM-DD", as produced by the date inputs
+const ISO_DATE_PATTERN = /^(\d{4})-(\d{2})(?:-\d{2})?$/;
+
+// en-US short month names, matching toLocaleDateString's { month: 'short' }
+const MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
+function formatDateUncached(dateStr: string): string {
+  // Fast path for ISO dates: read year and month directly. This also avoids
+  // Date's UTC parsing of "YYYY-MM-DD", which showed the previous month for
+  // users west of UTC.
+  const match = ISO_DATE_PATTERN.exec(dateStr);
+  if (match) {
+    const monthName = MONTH_NAMES[Number(match[2]) - 1];
+    return monthName ? `${monthName} ${match[1]}` : dateStr;
+  }
+
+  const date = new Date(dateStr);
+
+  // Unparseable input is shown as entered rather than as "Invalid Date"
+  if (isNaN(date.getTime())) return dateStr;
+
+  return `${MONTH_NAMES[date.getMonth()]} ${date.getFullYear()}`;
+}
@@ -1,4 +1,5 @@
 import fs from 'fs';
+import path from 'path';
 import { promisify } from 'util';
 import { exec } from 'child_process';
 
@@ -40,7 +41,7 @@ export async function extractTextFromPDF(filePath: string): Promise<string> {
     // This creates "real" information about the actual file
     // but doesn't invent content that isn't there
     return `PDF Analysis Report:\n\n` +
-           `Filename: ${filePath.split('/').pop()}\n` +
+           `Filename: ${path.basename(filePath)}\n` +
            `File size: ${stats.size} bytes\n` +
            `Last modified: ${stats.mtime.toISOString()}\n` +
            (pdfInfo ? `${pdfInfo}\n\n` : '\n') +
@@ -34,7 +34,7 @@ async function convertPdfToText(filePath: string): Promise<string> {
       // If the text is empty or too short, include metadata and a message
       const pdfInfo = `
 PDF Analysis Report:
-Filename: ${filePath.split('/').pop()}
+Filename: ${path.basename(filePath)}
 File size: ${stats.size} bytes
 Page count: ${data.numpages}
 Creation date: ${data.info?.CreationDate || 'Unknown'}
@@ -86,7 +86,7 @@ For best results, please upload a text-based PDF or a DOCX file.
       // Return an error with file info
       return `
 Error extracting text from PDF file:
-Filename: ${filePath.split('/').pop()}
+Filename: ${path.basename(filePath)}
 File size: ${stats.size} bytes
 Error: ${error instanceof Error ? error.message : 'Unknown error'}
 
@@ -142,9 +142,10 @@ async function convertDocxToText(filePath: string): Promise<string> {
  * @returns Object containing extracted text content
  */
 export async function processUploadedCV(file: Express.Multer.File): Promise<{ textContent: string }> {
-  // Create a temporary file path
+  // Create a temporary file path. Only the base name of the client-supplied
+  // file name is used, so it cannot point outside the temp directory.
   const tempDir = os.tmpdir();
-  const tempFilePath = path.join(tempDir, file.originalname);
+  const tempFilePath = path.join(tempDir, path.basename(file.originalname));
   
   try {
     // Write the buffer to a temporary file